@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 BLOCKFROST_MAINNET = "https://cardano-mainnet.blockfrost.io/api/v0"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockfrostPoint:
     slot: int
     block_hash: str
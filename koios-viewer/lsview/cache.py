@@ -0,0 +1,113 @@
+"""Best-effort on-disk cache for immutable Koios responses.
+
+Only data pinned by a content hash belongs here: a tx hash commits to its
+auxiliary data, so cached tx metadata can never go stale. The TTL just keeps
+the file from growing forever. Any cache failure falls back to the network.
+
+Location: $LS_KOIOS_CACHE (a file path, or "off" to disable), else
+$XDG_CACHE_HOME/lsview/koios.sqlite, else ~/.cache/lsview/koios.sqlite.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+CACHE_TTL = 7 * 86400
+
+_lock = threading.Lock()
+_db: Optional[sqlite3.Connection] = None
+_disabled = False
+
+
+def cache_path() -> Optional[Path]:
+    env = os.environ.get("LS_KOIOS_CACHE", "").strip()
+    if env.lower() in ("0", "off", "no", "false"):
+        return None
+    if env:
+        return Path(env).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "lsview" / "koios.sqlite"
+
+
+def _open() -> Optional[sqlite3.Connection]:
+    global _db, _disabled
+    if _db is not None or _disabled:
+        return _db
+    path = cache_path()
+    if path is None:
+        _disabled = True
+        return None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            "ns TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, stored REAL NOT NULL, "
+            "PRIMARY KEY (ns, key))"
+        )
+        # Expired rows are only skipped by lookups; drop them once per process.
+        db.execute("DELETE FROM kv WHERE stored < ?", (time.time() - CACHE_TTL,))
+        db.commit()
+    except (OSError, sqlite3.Error):
+        _disabled = True
+        return None
+    _db = db
+    return _db
+
+
+def get_many(ns: str, keys: Iterable[str]) -> Dict[str, Any]:
+    """Return the cached, unexpired values for whichever keys are present."""
+    keys = list(keys)
+    out: Dict[str, Any] = {}
+    with _lock:
+        db = _open()
+        if db is None or not keys:
+            return out
+        cutoff = time.time() - CACHE_TTL
+        try:
+            for i in range(0, len(keys), 500):  # stay under SQLITE_MAX_VARIABLE_NUMBER
+                chunk = keys[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = db.execute(
+                    f"SELECT key, value FROM kv WHERE ns = ? AND stored >= ? AND key IN ({marks})",
+                    (ns, cutoff, *chunk),
+                )
+                for key, value in rows:
+                    out[key] = json.loads(value)
+        except (sqlite3.Error, ValueError):
+            return {}
+    return out
+
+
+def put_many(ns: str, items: Dict[str, Any]) -> None:
+    if not items:
+        return
+    now = time.time()
+    with _lock:
+        db = _open()
+        if db is None:
+            return
+        try:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO kv (ns, key, value, stored) VALUES (?, ?, ?, ?)",
+                    [(ns, k, json.dumps(v), now) for k, v in items.items()],
+                )
+        except sqlite3.Error:
+            pass
+
+
+def close_cache() -> None:
+    """Close the cache; the next lookup re-reads LS_KOIOS_CACHE."""
+    global _db, _disabled
+    with _lock:
+        if _db is not None:
+            _db.close()
+        _db = None
+        _disabled = False
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .blockfrost import resolve_point_from_tx
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install lsview[fast])
+    orjson = None
+
 
 DEFAULT_CATALOG = Path(__file__).resolve().parent.parent / "examples" / "scrolls.json"
 
@@ -15,28 +23,36 @@ class CatalogError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogEntry:
     id: str
     data: Dict[str, Any]
 
 
+@lru_cache(maxsize=16)
+def _read_catalog(src: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse a catalog file once per (path, mtime, size)."""
+    try:
+        with open(src, "rb") as f:
+            data = f.read()
+        raw = orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError as exc:
+        raise CatalogError(f"Catalog is not valid JSON: {src} ({exc})") from exc
+    return tuple(item for item in raw.get("scrolls", []) if item.get("id"))
+
+
 def load_catalog(path: Optional[str] = None) -> Dict[str, CatalogEntry]:
     src = Path(path) if path else DEFAULT_CATALOG
     if not src.is_file():
         raise CatalogError(f"Catalog not found: {src} (pass --catalog <path>)")
-    try:
-        with open(src, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except ValueError as exc:
-        raise CatalogError(f"Catalog is not valid JSON: {src} ({exc})") from exc
+    st = src.stat()
 
+    # Entries get their own top-level dicts so callers (refresh_catalog) can
+    # update fields without touching the cached parse.
     entries: Dict[str, CatalogEntry] = {}
-    for item in raw.get("scrolls", []):
-        sid = item.get("id")
-        if not sid:
-            continue
-        entries[str(sid)] = CatalogEntry(id=str(sid), data=item)
+    for item in _read_catalog(str(src), st.st_mtime_ns, st.st_size):
+        sid = str(item["id"])
+        entries[sid] = CatalogEntry(id=sid, data=dict(item))
 
     return entries
 
@@ -44,12 +60,35 @@ def load_catalog(path: Optional[str] = None) -> Dict[str, CatalogEntry]:
 def save_catalog(entries: Dict[str, CatalogEntry], path: Optional[str] = None) -> None:
     src = Path(path) if path else DEFAULT_CATALOG
     payload = {"scrolls": [e.data for e in entries.values()]}
-    with open(src, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=False)
-        f.write("\n")
-
-
-def refresh_catalog(path: Optional[str] = None, blockfrost_key: Optional[str] = None) -> Dict[str, CatalogEntry]:
+    # Serialize up front so the file is written in one call, not chunk by chunk.
+    # Always the stdlib encoder: orjson writes non-ASCII as raw UTF-8 where
+    # json escapes it, and the file should not depend on the [fast] extra.
+    blob = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    try:
+        if src.read_bytes() == blob:
+            return
+    except OSError:
+        pass
+    # Write beside the target and rename over it, so an interrupted save never
+    # leaves a truncated catalog behind. Resolve symlinks so the link survives,
+    # and keep the existing file's permissions on the replacement.
+    real = Path(os.path.realpath(src))
+    tmp = real.with_name(real.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    if real.exists():
+        shutil.copymode(real, tmp)
+    os.replace(tmp, real)
+
+
+def refresh_catalog(
+    path: Optional[str] = None, blockfrost_key: Optional[str] = None, force: bool = False
+) -> Dict[str, CatalogEntry]:
+    """Fill in block_slot/block_hash for each entry's tx via Blockfrost.
+
+    A confirmed tx never moves to another block, so entries that already have
+    both fields are skipped unless force is set.
+    """
     entries = load_catalog(path)
 
     for entry in entries.values():
@@ -57,6 +96,8 @@ def refresh_catalog(path: Optional[str] = None, blockfrost_key: Optional[str] =
         tx_hash = data.get("tx_hash") or data.get("manifest_tx")
         if not tx_hash:
             continue
+        if not force and data.get("block_slot") is not None and data.get("block_hash"):
+            continue
 
         try:
             point = resolve_point_from_tx(tx_hash, blockfrost_key)
@@ -6,14 +6,18 @@ import hashlib
 import json
 import os
 import sys
+from contextlib import closing
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import cbor2
 
 from .catalog import CatalogError, load_catalog
 from .koios import (
+    FETCH_WORKERS,
     KoiosError,
     asset_info_batch,
+    fetch_batches,
     get_inline_datum_hex_from_utxo_info_row,
     policy_asset_list,
     tx_metadata,
@@ -21,6 +25,16 @@ from .koios import (
     with_retries,
 )
 
+try:
+    from isal import isal_zlib
+except ImportError:  # optional speedup (pip install lsview[fast])
+    isal_zlib = None
+
+# ISA-L inflate is zlib-compatible (wbits, max_length, unconsumed_tail) but
+# raises its own error type.
+_inflate = isal_zlib or zlib
+_INFLATE_ERRORS = (zlib.error,) if isal_zlib is None else (zlib.error, isal_zlib.error)
+
 
 LIBRARY_POLICY_ID = "8d6d38b3967028a15fc0e401b53c73a75ac654affc3f817c750c8b80"
 # Pre-NFT datum head, long spent. Kept only for --legacy-head archaeology.
@@ -42,35 +56,66 @@ def require_canonical_lock(row: Dict[str, Any]) -> None:
         raise RegistryError(f"Scroll output is not at the expected always-fail address: {addr}")
 
 
-def sha256_hex(b: bytes) -> str:
+def sha256_hex(b: bytes | bytearray | memoryview) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
-def gunzip_bounded(data: bytes, expected_size: int, hard_limit: int = 128 * 1024 * 1024) -> bytes:
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class _BoundedGunzip:
+    """Incremental gunzip that never produces more than the declared size,
+    or more than hard_limit when no size is declared (CIP-25 scrolls).
+
+    feed() takes compressed chunks as they arrive; the output is hashed as it
+    is produced, so callers get the decoded SHA-256 without another pass.
+    """
+
+    def __init__(self, expected_size: int | None, hard_limit: int = 128 * 1024 * 1024) -> None:
+        if expected_size is None:
+            self.limit = hard_limit
+            self._overflow = f"Decoded stream exceeds safe limit ({hard_limit} bytes)"
+        elif expected_size < 0 or expected_size > hard_limit:
+            raise RegistryError(f"Decoded size exceeds safe limit ({hard_limit} bytes)")
+        else:
+            self.limit = expected_size
+            self._overflow = "Decoded stream exceeds declared size"
+        self.expected_size = expected_size
+        self.out = bytearray()
+        self.sha = hashlib.sha256()
+        self._dec = _inflate.decompressobj(16 + _inflate.MAX_WBITS)
+
+    def _take(self, chunk: bytes) -> None:
+        self.sha.update(chunk)
+        self.out += chunk
+
+    def feed(self, data: bytes | bytearray) -> None:
+        # max_length is always >= 1 here (0 would mean "unbounded")
+        self._take(self._dec.decompress(data, self.limit + 1 - len(self.out)))
+        if len(self.out) > self.limit or self._dec.unconsumed_tail:
+            raise RegistryError(self._overflow)
+
+    def finish(self) -> bytearray:
+        self._take(self._dec.flush(self.limit + 1 - len(self.out)))
+        if self.expected_size is not None and len(self.out) != self.expected_size:
+            raise RegistryError(f"Decoded size mismatch: got {len(self.out)} expected {self.expected_size}")
+        if len(self.out) > self.limit:
+            raise RegistryError(self._overflow)
+        return self.out
+
+
+def gunzip_bounded(data: bytes | bytearray, expected_size: int, hard_limit: int = 128 * 1024 * 1024) -> bytes:
     """Decompress without allowing a small gzip member to exhaust memory."""
-    limit = min(expected_size, hard_limit)
-    if expected_size < 0 or expected_size > hard_limit:
-        raise RegistryError(f"Decoded size exceeds safe limit ({hard_limit} bytes)")
-    dec = zlib.decompressobj(16 + zlib.MAX_WBITS)
-    out = dec.decompress(data, limit + 1)
-    if len(out) > limit or dec.unconsumed_tail:
-        raise RegistryError("Decoded stream exceeds declared size")
-    out += dec.flush(limit + 1 - len(out))
-    if len(out) != expected_size:
-        raise RegistryError(f"Decoded size mismatch: got {len(out)} expected {expected_size}")
-    return out
+    dec = _BoundedGunzip(expected_size, hard_limit)
+    dec.feed(data)
+    return bytes(dec.finish())
 
 
-def gunzip_capped(data: bytes, hard_limit: int = 128 * 1024 * 1024) -> bytes:
+def gunzip_capped(data: bytes | bytearray, hard_limit: int = 128 * 1024 * 1024) -> bytes:
     """Like gunzip_bounded, for streams with no declared size (CIP-25 scrolls)."""
-    dec = zlib.decompressobj(16 + zlib.MAX_WBITS)
-    out = dec.decompress(data, hard_limit + 1)
-    if len(out) > hard_limit or dec.unconsumed_tail:
-        raise RegistryError(f"Decoded stream exceeds safe limit ({hard_limit} bytes)")
-    out += dec.flush()
-    if len(out) > hard_limit:
-        raise RegistryError(f"Decoded stream exceeds safe limit ({hard_limit} bytes)")
-    return out
+    dec = _BoundedGunzip(None, hard_limit)
+    dec.feed(data)
+    return bytes(dec.finish())
 
 
 def _hex_to_ascii(hex_str: str) -> str:
@@ -80,22 +125,50 @@ def _hex_to_ascii(hex_str: str) -> str:
         return ""
 
 
-def _extract_cip721(meta: Any) -> Dict[str, Any] | None:
-    # Koios tx_metadata returns different shapes; support common ones.
+CIP25_LABEL = "721"
+# Field aliases seen across CIP-25 scroll mints, in preference order.
+CIP25_INDEX_KEYS = ("i", "index")
+CIP25_PAYLOAD_KEYS = ("payload", "segments", "seg")
+
+
+def _metadata_label(meta: Any, label: str) -> Any:
+    """Return the value of one metadata label, or None.
+
+    Koios renders tx metadata either as a {label: value} map (JSON string
+    keys, occasionally int keys) or as a list of {label, json_metadata} rows.
+    Only the wanted label is probed; the string key is tried first because
+    that is what Koios returns.
+    """
     if isinstance(meta, dict):
-        if "721" in meta:
-            return meta["721"]
-        if 721 in meta:
-            return meta[721]
-        return None
+        value = meta.get(label)
+        if value is None:
+            value = meta.get(int(label))
+        return value
     if isinstance(meta, list):
         for item in meta:
-            if isinstance(item, dict) and str(item.get("label")) == "721":
+            if isinstance(item, dict) and str(item.get("label")) == label:
                 return item.get("json_metadata") or item.get("metadata") or item.get("value")
     return None
 
 
+def _first_set(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """``d.get(k1) or d.get(k2) or ...`` over a key tuple: the first truthy
+    value, else whatever the last key held."""
+    v = None
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return v
+
+
+def _extract_cip721(meta: Any) -> Dict[str, Any] | None:
+    return _metadata_label(meta, CIP25_LABEL)
+
+
+@lru_cache(maxsize=256)
 def _decode_registry_datum_to_json(datum_hex: str) -> Dict[str, Any]:
+    # Cached per datum: callers treat the returned object as read-only.
     raw = bytes.fromhex(datum_hex)
 
     # The standard datum encoding we minted is "CBOR bytes -> JSON bytes".
@@ -203,9 +276,8 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
 
     # Fetch tx metadata only for assets whose asset_info row lacked it
     meta_by_tx: Dict[str, Any] = {}
-    for i in range(0, len(mint_txs), 5):
-        batch = mint_txs[i : i + 5]
-        meta_by_tx.update(with_retries(lambda b=batch: tx_metadata(b)))
+    for _, meta in fetch_batches(lambda b: with_retries(lambda: tx_metadata(b)), mint_txs, 25):
+        meta_by_tx.update(meta)
 
     pages: List[Tuple[int, List[str]]] = []
 
@@ -230,7 +302,7 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
         # (e.g. BTCWP pages declare codec=gzip), so only treat an asset as
         # a manifest when it says so or clearly carries no page payload.
         role = asset_meta.get("role")
-        has_payload = any(k in asset_meta for k in ("payload", "segments", "seg"))
+        has_payload = any(k in asset_meta for k in CIP25_PAYLOAD_KEYS)
         is_manifest = False
         if manifest_asset and asset_ascii == manifest_asset:
             is_manifest = True
@@ -243,7 +315,7 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
         if is_manifest:
             continue
 
-        idx = asset_meta.get("i") or asset_meta.get("index")
+        idx = _first_set(asset_meta, CIP25_INDEX_KEYS)
         if idx is None:
             continue
         try:
@@ -251,7 +323,7 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
         except Exception:
             continue
 
-        payload = asset_meta.get("payload") or asset_meta.get("segments") or asset_meta.get("seg") or []
+        payload = _first_set(asset_meta, CIP25_PAYLOAD_KEYS) or []
         if isinstance(payload, str):
             payload = [payload]
         if not isinstance(payload, list):
@@ -274,15 +346,44 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
         return seg[2:] if seg.lower().startswith("0x") else seg
 
     pages.sort(key=lambda x: x[0])
-    hex_blob = "".join("".join(_clean_seg(seg) for seg in payload) for _, payload in pages)
+    # One fromhex per page: segments are tiny (64 hex chars), so per-call
+    # overhead would dominate, but a whole-scroll hex string doubles peak
+    # memory. A page may end mid-byte, so an odd trailing nibble carries over.
+    # Once the stream is known to be gzip, pages are inflated as they are
+    # decoded; inflate errors wait until every page's hex has been checked.
+    buf = bytearray()
+    gunzip: _BoundedGunzip | None = None
+    inflate_error: Exception | None = None
+    carry = ""
     try:
-        raw = bytes.fromhex(hex_blob)
+        for _, payload in pages:
+            # fromhex skips whitespace, so drop it before counting nibbles.
+            page_hex = carry + "".join("".join(_clean_seg(seg).split()) for seg in payload)
+            cut = len(page_hex) & ~1
+            carry = page_hex[cut:]
+            buf += bytes.fromhex(page_hex[:cut])
+            if gunzip is None and buf.startswith(GZIP_MAGIC):
+                gunzip = _BoundedGunzip(None)
+            if gunzip is not None:
+                if inflate_error is None:
+                    try:
+                        gunzip.feed(buf)
+                    except (RegistryError, *_INFLATE_ERRORS) as exc:
+                        inflate_error = exc
+                buf.clear()
+        if carry:
+            raise ValueError("odd-length hex string")
     except ValueError as exc:
         raise RegistryError(f"Malformed hex in page segments: {exc}") from exc
-    if raw.startswith(b"\x1f\x8b"):
-        raw = gunzip_capped(raw)
+    if inflate_error is not None:
+        raise inflate_error
+    if gunzip is not None:
+        raw = bytes(gunzip.finish())
+        sha = gunzip.sha.hexdigest()
+    else:
+        raw = bytes(buf)
+        sha = sha256_hex(raw)
 
-    sha = sha256_hex(raw)
     if expected_sha256 and sha.lower() != expected_sha256.lower():
         raise RegistryError(f"SHA-256 mismatch: got {sha} expected {expected_sha256}")
 
@@ -292,20 +393,41 @@ def reconstruct_legacy_cip25(policy_id: str, manifest_asset: str | None = None,
 LSCHAIN_LABEL = "22025"
 
 
-def _meta_value_to_bytes(v: Any) -> bytes:
-    """Decode a metadata byte value as indexers variously render it:
-    '0x<hex>' string, bare hex string, or {'bytes': '<hex>'} object."""
+def _meta_hex(v: Any) -> str:
     if isinstance(v, dict):
         v = v.get("bytes") or ""
     s = str(v).strip()
-    if s.lower().startswith("0x"):
-        s = s[2:]
+    return s[2:] if s.lower().startswith("0x") else s
+
+
+def _meta_value_to_bytes(v: Any) -> bytes:
+    """Decode a metadata byte value as indexers variously render it:
+    '0x<hex>' string, bare hex string, or {'bytes': '<hex>'} object."""
+    s = _meta_hex(v)
     try:
         return bytes.fromhex(s)
     except ValueError as exc:
         raise RegistryError(f"Malformed hex in metadata value: {s[:32]!r}") from exc
 
 
+def _meta_values_to_bytes(values: List[Any]) -> bytes:
+    """b"".join(_meta_value_to_bytes(v) for v in values) with a single
+    fromhex call. Anything the joined decode could paper over (odd-length or
+    whitespace-padded segments, bad hex) is re-decoded per segment so the
+    result and the error stay exactly those of the per-segment path."""
+    hexes = [_meta_hex(v) for v in values]
+    joined = "".join(hexes)
+    if not any(len(h) & 1 for h in hexes):
+        try:
+            out = bytes.fromhex(joined)
+        except ValueError:
+            pass
+        else:
+            if 2 * len(out) == len(joined):
+                return out
+    return b"".join(_meta_value_to_bytes(v) for v in values)
+
+
 def _parse_chain_manifest(datum_hex: str) -> Dict[str, Any]:
     """Decode an LS-CHAIN v2 manifest datum (Constr 0, see spec)."""
     decoded = cbor2.loads(bytes.fromhex(datum_hex))
@@ -331,8 +453,11 @@ def _parse_chain_manifest(datum_hex: str) -> Dict[str, Any]:
     }
 
 
-def reconstruct_chain_from_txin(txin: str) -> Tuple[bytes, Dict[str, Any]]:
-    """Reconstruct an LS-CHAIN v2 scroll. Returns (decoded bytes, manifest)."""
+def reconstruct_chain_from_txin(txin: str, *, workers: int = FETCH_WORKERS) -> Tuple[bytes, Dict[str, Any]]:
+    """Reconstruct an LS-CHAIN v2 scroll. Returns (decoded bytes, manifest).
+
+    `workers` bounds how many page-metadata requests run ahead of decoding.
+    """
     row = with_retries(lambda: utxo_info(txin))
     require_canonical_lock(row)
     manifest = _parse_chain_manifest(get_inline_datum_hex_from_utxo_info_row(row))
@@ -359,45 +484,62 @@ def reconstruct_chain_from_txin(txin: str) -> Tuple[bytes, Dict[str, Any]]:
     if len(page_hashes) > 25000:
         raise RegistryError("Page count exceeds safe limit (25000)")
 
-    meta_by_tx: Dict[str, Any] = {}
-    for i in range(0, len(page_hashes), 25):
-        batch = page_hashes[i : i + 25]
-        meta_by_tx.update(with_retries(lambda b=batch: tx_metadata(b)))
-
+    # Pages are decoded batch by batch while later tx_metadata batches are
+    # still in flight (see koios.fetch_batches). Each page is hashed into the
+    # encoded digest and, for gzip, inflated straight away, so the encoded
+    # stream is never held whole. Inflate errors wait until the encoded hash
+    # has been checked: a corrupt stream reports as a hash mismatch.
+    sha_encoded = hashlib.sha256()
     encoded = bytearray()
-    for idx, tx_hash in enumerate(page_hashes, start=1):
-        meta = meta_by_tx.get(tx_hash)
-        page = None
-        if isinstance(meta, dict):
-            page = meta.get(LSCHAIN_LABEL) or meta.get(int(LSCHAIN_LABEL))
-        elif isinstance(meta, list):
-            for item in meta:
-                if isinstance(item, dict) and str(item.get("label")) == LSCHAIN_LABEL:
-                    page = item.get("json_metadata") or item.get("metadata")
-                    break
-        if not isinstance(page, dict):
-            raise RegistryError(f"Page {idx} metadata missing for tx {tx_hash}")
+    gunzip: _BoundedGunzip | None = None
+    inflate_error: Exception | None = None
+    if manifest["codec"] == "gzip":
         try:
-            page_i, page_n = int(page.get("i", -1)), int(page.get("n", -1))
-        except (TypeError, ValueError) as exc:
-            raise RegistryError(f"Page {idx} has malformed i/n metadata (tx {tx_hash})") from exc
-        if page_i != idx or page_n != len(page_hashes):
-            raise RegistryError(f"Page {idx} index/count mismatch (tx {tx_hash})")
-        payload = b"".join(_meta_value_to_bytes(seg) for seg in page.get("p") or [])
-        sha = page.get("sha")
-        if sha is not None and sha256_hex(payload) != _meta_value_to_bytes(sha).hex():
-            raise RegistryError(f"Page {idx} hash mismatch (tx {tx_hash})")
-        encoded.extend(payload)
-
-    encoded = bytes(encoded)
-    if sha256_hex(encoded) != manifest["sha256Encoded"]:
+            gunzip = _BoundedGunzip(manifest["sizeDecoded"])
+        except RegistryError as exc:
+            inflate_error = exc
+    idx = 0
+    fetched = fetch_batches(lambda b: with_retries(lambda: tx_metadata(b)), page_hashes, 25, workers=workers)
+    with closing(fetched):
+        for batch, meta_by_tx in fetched:
+            for tx_hash in batch:
+                idx += 1
+                page = _metadata_label(meta_by_tx.get(tx_hash), LSCHAIN_LABEL)
+                if not isinstance(page, dict):
+                    raise RegistryError(f"Page {idx} metadata missing for tx {tx_hash}")
+                try:
+                    page_i, page_n = int(page.get("i", -1)), int(page.get("n", -1))
+                except (TypeError, ValueError) as exc:
+                    raise RegistryError(f"Page {idx} has malformed i/n metadata (tx {tx_hash})") from exc
+                if page_i != idx or page_n != len(page_hashes):
+                    raise RegistryError(f"Page {idx} index/count mismatch (tx {tx_hash})")
+                payload = _meta_values_to_bytes(page.get("p") or [])
+                sha = page.get("sha")
+                if sha is not None and sha256_hex(payload) != _meta_value_to_bytes(sha).hex():
+                    raise RegistryError(f"Page {idx} hash mismatch (tx {tx_hash})")
+                sha_encoded.update(payload)
+                if gunzip is not None:
+                    try:
+                        gunzip.feed(payload)
+                    except (RegistryError, *_INFLATE_ERRORS) as exc:
+                        gunzip, inflate_error = None, exc
+                elif inflate_error is None:
+                    encoded += payload
+
+    if sha_encoded.hexdigest() != manifest["sha256Encoded"]:
         raise RegistryError("Encoded stream hash mismatch")
-    decoded = gunzip_bounded(encoded, manifest["sizeDecoded"]) if manifest["codec"] == "gzip" else encoded
-    if len(decoded) != manifest["sizeDecoded"]:
+    if inflate_error is not None:
+        raise inflate_error
+    if gunzip is not None:
+        out, sha_decoded = gunzip.finish(), gunzip.sha.hexdigest()
+    else:
+        # codec none: the decoded bytes are the encoded bytes
+        out, sha_decoded = encoded, sha_encoded.hexdigest()
+    if len(out) != manifest["sizeDecoded"]:
         raise RegistryError("Decoded size mismatch")
-    if sha256_hex(decoded) != manifest["sha256Decoded"]:
+    if sha_decoded != manifest["sha256Decoded"]:
         raise RegistryError("Decoded file hash mismatch")
-    return decoded, manifest
+    return bytes(out), manifest
 
 
 def cmd_reconstruct_chain(args) -> None:
@@ -417,7 +559,7 @@ def cmd_reconstruct_chain(args) -> None:
     if not args.txin:
         raise RegistryError("Provide --txin <txHash#txIx> or --scroll")
 
-    data, manifest = reconstruct_chain_from_txin(args.txin)
+    data, manifest = reconstruct_chain_from_txin(args.txin, workers=args.workers)
     if args.out:
         with open(args.out, "wb") as f:
             f.write(data)
@@ -425,7 +567,7 @@ def cmd_reconstruct_chain(args) -> None:
     print(f"Content-Type: {manifest['contentType']}  codec: {manifest['codec']}")
     print(f"Pages: {len(manifest['pageTxHashes'])}")
     print(f"Bytes: {len(data)}")
-    print(f"SHA-256: {sha256_hex(data)}  (verified against manifest)")
+    print(f"SHA-256: {manifest['sha256Decoded']}  (verified against manifest)")
 
 
 def _merge_registry_lists(base: Dict[str, Any], extra: Dict[str, Any], *, extra_label: str) -> Dict[str, Any]:
@@ -442,8 +584,9 @@ def _merge_registry_lists(base: Dict[str, Any], extra: Dict[str, Any], *, extra_
     if not isinstance(base_entries, list) or not isinstance(extra_entries, list):
         raise RegistryError("Cannot merge: entries must be lists")
 
+    # Dicts keep first-insertion order when a key is overwritten, so an
+    # override stays in the slot where the name first appeared.
     out_map: Dict[str, Dict[str, Any]] = {}
-    order: List[str] = []
 
     def add_entries(entries: List[Any], label: str) -> None:
         for e in entries:
@@ -452,8 +595,6 @@ def _merge_registry_lists(base: Dict[str, Any], extra: Dict[str, Any], *, extra_
             name = e.get("name")
             if not isinstance(name, str) or not name:
                 continue
-            if name not in out_map:
-                order.append(name)
             # override
             ee = dict(e)
             ee.setdefault("_source", label)
@@ -463,7 +604,7 @@ def _merge_registry_lists(base: Dict[str, Any], extra: Dict[str, Any], *, extra_
     add_entries(extra_entries, extra_label)
 
     merged = dict(base)
-    merged["entries"] = [out_map[n] for n in order]
+    merged["entries"] = list(out_map.values())
     return merged
 
 
@@ -542,12 +683,12 @@ def resolve_registry_nft(policy_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]
 
     best: Optional[Dict[str, Any]] = None
     best_v = -1
+    best_list: Dict[str, Any] = {}
     for info in rows:
         md = _asset_721_fields(info, policy_id)
         if not isinstance(md, dict) or md.get("Type") != "Registry Head":
             continue
-        meta = info.get("minting_tx_metadata") or {}
-        lst = meta.get(REGISTRY_LIST_LABEL) or meta.get(int(REGISTRY_LIST_LABEL))
+        lst = _metadata_label(info.get("minting_tx_metadata"), REGISTRY_LIST_LABEL)
         if not isinstance(lst, dict):
             continue
         try:
@@ -557,18 +698,22 @@ def resolve_registry_nft(policy_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]
         if v > best_v:
             best_v = v
             best = info
+            best_list = lst
     if best is None:
         raise RegistryError(f"No registry head NFT under policy {policy_id}")
 
-    meta = best.get("minting_tx_metadata") or {}
-    lst = meta.get(REGISTRY_LIST_LABEL) or meta.get(int(REGISTRY_LIST_LABEL))
     head = {
         "policy": policy_id,
         "asset": best.get("asset_name_ascii") or _hex_to_ascii(best.get("asset_name") or ""),
         "version": best_v,
         "mint_tx": best.get("minting_tx_hash"),
     }
-    return head, _expand_registry_nft_entries(lst)
+    return head, _expand_registry_nft_entries(best_list)
+
+
+def _json_pretty(obj: Any) -> bytes:
+    # Always the stdlib encoder, so stdout and --out match with or without orjson.
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 def cmd_registry_dump(args) -> None:
@@ -595,12 +740,12 @@ def cmd_registry_dump(args) -> None:
     }
 
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(out, f, indent=2)
-            f.write("\n")
+        with open(args.out, "wb") as f:
+            f.write(_json_pretty(out))
+            f.write(b"\n")
         print(f"Wrote: {args.out}")
     else:
-        print(json.dumps(out, indent=2))
+        print(_json_pretty(out).decode("utf-8"))
 
 
 def cmd_list_scrolls(args) -> None:
@@ -700,6 +845,7 @@ def build_parser() -> argparse.ArgumentParser:
     rch.add_argument("--catalog", help="Path to catalog JSON (defaults to examples/scrolls.json)")
     rch.add_argument("--txin", help="Manifest TxIn as <txHash#txIx>")
     rch.add_argument("--out", help="Output filename")
+    rch.add_argument("--workers", type=int, default=FETCH_WORKERS, help=f"Page-metadata requests kept in flight (default {FETCH_WORKERS}; env LS_KOIOS_WORKERS)")
     rch.set_defaults(func=cmd_reconstruct_chain)
 
     ls = sp.add_parser("list-scrolls", help="List known scrolls from catalog")
@@ -1,31 +1,122 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from . import cache
 
 KOIOS = os.environ.get("LS_KOIOS", "https://api.koios.rest/api/v1").rstrip("/")
 
 
+def _env_workers(default: int = 4) -> int:
+    # Read at import time, so a bad value must not break every command.
+    try:
+        return max(1, int(os.environ.get("LS_KOIOS_WORKERS", default)))
+    except ValueError:
+        return default
+
+
+# Koios requests kept in flight by fetch_batches (public tier rate limits apply).
+FETCH_WORKERS = _env_workers()
+
+T = TypeVar("T")
+
+
 class KoiosError(RuntimeError):
     pass
 
 
-def _get_json(url: str, timeout: int = 30) -> Any:
-    req = urllib.request.Request(url, headers={"Accept": "application/json"})
+# One keep-alive connection per (thread, scheme, host): a scroll read makes
+# dozens of Koios calls, and each fresh urlopen pays TCP + TLS setup again.
+_conns = threading.local()
+_STALE = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+def _connection(scheme: str, netloc: str, timeout: int) -> http.client.HTTPConnection:
+    pool = _conns.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    conn = _conns.__dict__.get("pool", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def close_connections() -> None:
+    """Close this thread's pooled Koios connections."""
+    for conn in _conns.__dict__.pop("pool", {}).values():
+        conn.close()
+
+
+def _request_json(url: str, data: Optional[bytes], headers: Dict[str, str], timeout: int) -> Any:
+    """Send one request over a pooled connection.
+
+    Failures are raised as urllib.error.HTTPError / URLError so with_retries
+    classifies them exactly as it did for urlopen. Requests fall back to
+    urlopen when a proxy is configured, which http.client does not honour.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or urllib.request.getproxies():
+        return _urlopen_json(url, data, headers, timeout)
+
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    method = "GET" if data is None else "POST"
+    for attempt in range(2):
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except _STALE as exc:
+            # The server may close an idle keep-alive socket; retry once fresh.
+            _drop_connection(parts.scheme, parts.netloc)
+            if attempt:
+                raise urllib.error.URLError(exc) from exc
+            continue
+        except (OSError, http.client.HTTPException) as exc:
+            _drop_connection(parts.scheme, parts.netloc)
+            if isinstance(exc, TimeoutError):
+                raise
+            raise urllib.error.URLError(exc) from exc
+        if resp.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        if resp.status >= 300:
+            # Let urlopen follow redirects (e.g. a mirror moving to https).
+            return _urlopen_json(url, data, headers, timeout)
+        return json.loads(body.decode("utf-8"))
+    raise urllib.error.URLError("unreachable")
+
+
+def _urlopen_json(url: str, data: Optional[bytes], headers: Dict[str, str], timeout: int) -> Any:
+    req = urllib.request.Request(url, data=data, headers=headers)
     with urllib.request.urlopen(req, timeout=timeout) as resp:
         return json.loads(resp.read().decode("utf-8"))
 
 
+def _get_json(url: str, timeout: int = 30) -> Any:
+    return _request_json(url, None, {"Accept": "application/json"}, timeout)
+
+
 def _post_json(url: str, payload: Dict[str, Any], timeout: int = 30) -> Any:
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json", "Accept": "application/json"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    return _request_json(url, data, {"Content-Type": "application/json", "Accept": "application/json"}, timeout)
 
 
 def koios_post(path: str, payload: Dict[str, Any], timeout: int = 30) -> Any:
@@ -38,6 +129,57 @@ def koios_get(path: str, timeout: int = 30) -> Any:
     return _get_json(url, timeout=timeout)
 
 
+# One long-lived pool per worker count. Its threads outlive each
+# fetch_batches call, so the keep-alive connections they hold in _conns are
+# reused by later batches and calls; they are closed when the process exits.
+_pools: Dict[int, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _fetch_pool(workers: int) -> ThreadPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lsview-koios")
+        return pool
+
+
+def fetch_batches(
+    fetch: Callable[[List[str]], T],
+    items: List[str],
+    size: int,
+    *,
+    workers: int = FETCH_WORKERS,
+) -> Iterator[Tuple[List[str], T]]:
+    """Yield (batch, fetch(batch)) for consecutive batches of items, in order.
+
+    Up to `workers` batches are fetched ahead on a thread pool, so request
+    latency overlaps with whatever the caller does with earlier batches.
+    Closing the generator early cancels the fetches not yet started.
+    """
+    batches = iter([items[i : i + size] for i in range(0, len(items), size)])
+    if workers <= 1:
+        for batch in batches:
+            yield batch, fetch(batch)
+        return
+    pool = _fetch_pool(workers)
+    pending = deque()
+    try:
+        for batch in batches:
+            pending.append((batch, pool.submit(fetch, batch)))
+            if len(pending) >= workers:
+                break
+        while pending:
+            batch, fut = pending.popleft()
+            nxt = next(batches, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(fetch, nxt)))
+            yield batch, fut.result()
+    finally:
+        for _, fut in pending:
+            fut.cancel()
+
+
 # --- Existing helpers (used by older code; kept for compatibility) ---
 
 def _normalize_block_row(row: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,6 +198,18 @@ def block_info_by_height(height: int) -> Dict[str, Any]:
     return _normalize_block_row(rows[0])
 
 
+def block_info_by_heights(heights: List[int], *, chunk_size: int = 100) -> Dict[int, Dict[str, Any]]:
+    """Resolve many block heights with one blocks query per chunk."""
+    out: Dict[int, Dict[str, Any]] = {}
+    uniq = sorted({int(h) for h in heights})
+    for i in range(0, len(uniq), chunk_size):
+        chunk = ",".join(str(h) for h in uniq[i : i + chunk_size])
+        for row in koios_get(f"blocks?block_height=in.({chunk})") or []:
+            b = _normalize_block_row(row)
+            out[b["height"]] = b
+    return out
+
+
 def block_info_by_hash(block_hash: str) -> Dict[str, Any]:
     rows = koios_get(f"blocks?hash=eq.{urllib.parse.quote(block_hash)}")
     if not rows:
@@ -63,16 +217,27 @@ def block_info_by_hash(block_hash: str) -> Dict[str, Any]:
     return _normalize_block_row(rows[0])
 
 
+def tx_points(tx_hashes: List[str], *, chunk_size: int = 100) -> Dict[str, Dict[str, Any]]:
+    """Map tx hash -> the block point it landed in, one tx_info POST per
+    chunk. Unknown hashes are absent from the result."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(tx_hashes), chunk_size):
+        rows = koios_post("tx_info", {"_tx_hashes": tx_hashes[i : i + chunk_size]}) or []
+        for row in rows:
+            out[str(row["tx_hash"])] = {
+                "slot": int(row["absolute_slot"]),
+                "hash": str(row["block_hash"]),
+                "height": int(row["block_height"]),
+            }
+    return out
+
+
+@lru_cache(maxsize=1024)
 def tx_point(tx_hash: str) -> Dict[str, Any]:
-    rows = koios_post("tx_info", {"_tx_hashes": [tx_hash]})
-    if not rows:
+    point = tx_points([tx_hash]).get(tx_hash)
+    if point is None:
         raise RuntimeError("tx_info returned empty")
-    row = rows[0]
-    return {
-        "slot": int(row["absolute_slot"]),
-        "hash": str(row["block_hash"]),
-        "height": int(row["block_height"]),
-    }
+    return point
 
 
 def prev_point_from_height(height: int) -> Dict[str, Any]:
@@ -87,10 +252,13 @@ def prev_point_from_tx(tx_hash: str) -> Dict[str, Any]:
 # --- Koios: scroll primitives (Koios-first viewer path) ---
 
 
+@lru_cache(maxsize=1024)
 def utxo_info(txin: str) -> Dict[str, Any]:
     """Return the Koios utxo_info row for a txin (<txhash>#<ix>).
 
     _extended is required: without it Koios omits inline_datum/datum_hash.
+    Memoized per process (rows are shared; treat them as read-only), so a
+    long-lived caller that needs fresh spent state should clear_koios_caches().
     """
     rows = koios_post("utxo_info", {"_utxo_refs": [txin], "_extended": True})
     if not rows:
@@ -112,6 +280,7 @@ def policy_asset_list(policy_id: str) -> List[Dict[str, Any]]:
     return koios_post("policy_asset_list", {"_asset_policy": policy_id}) or []
 
 
+@lru_cache(maxsize=1024)
 def asset_info(policy_id: str, asset_name_hex: str) -> Dict[str, Any]:
     rows = koios_post("asset_info", {"_asset_list": [[policy_id, asset_name_hex]]})
     if not rows:
@@ -119,26 +288,53 @@ def asset_info(policy_id: str, asset_name_hex: str) -> Dict[str, Any]:
     return rows[0]
 
 
-def asset_info_batch(policy_id: str, asset_name_hexes: List[str], *, chunk_size: int = 50) -> List[Dict[str, Any]]:
-    """Fetch asset_info rows for many assets of one policy in few requests."""
+def asset_info_batch(
+    policy_id: str,
+    asset_name_hexes: List[str],
+    *,
+    chunk_size: int = 50,
+    workers: int = FETCH_WORKERS,
+) -> List[Dict[str, Any]]:
+    """Fetch asset_info rows for many assets of one policy in few requests.
+
+    Chunks are requested concurrently (see fetch_batches); rows come back in
+    chunk order.
+    """
+
+    def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+        return koios_post("asset_info", {"_asset_list": [[policy_id, h] for h in chunk]}) or []
+
     out: List[Dict[str, Any]] = []
-    for i in range(0, len(asset_name_hexes), chunk_size):
-        chunk = asset_name_hexes[i : i + chunk_size]
-        rows = koios_post("asset_info", {"_asset_list": [[policy_id, h] for h in chunk]}) or []
+    for _, rows in fetch_batches(fetch, asset_name_hexes, chunk_size, workers=workers):
         out.extend(rows)
     return out
 
 
 def tx_metadata(tx_hashes: List[str]) -> Dict[str, Any]:
-    rows = koios_post("tx_metadata", {"_tx_hashes": tx_hashes}) or []
-    out: Dict[str, Any] = {}
+    """Map tx hash -> metadata. Hashes already in the disk cache (see
+    lsview.cache) are not re-requested; unknown hashes are simply absent."""
+    ns = f"{KOIOS}/tx_metadata"
+    out = cache.get_many(ns, tx_hashes)
+    missing = [h for h in tx_hashes if h not in out]
+    if not missing:
+        return out
+    rows = koios_post("tx_metadata", {"_tx_hashes": missing}) or []
+    fresh: Dict[str, Any] = {}
     for row in rows:
         tx = row.get("tx_hash")
         if tx:
-            out[str(tx)] = row.get("metadata")
+            fresh[str(tx)] = row.get("metadata")
+    cache.put_many(ns, fresh)
+    out.update(fresh)
     return out
 
 
+def clear_koios_caches() -> None:
+    """Forget memoized utxo_info / asset_info / tx_point results."""
+    for fn in (utxo_info, asset_info, tx_point):
+        fn.cache_clear()
+
+
 _TRANSIENT_HTTP = {429, 500, 502, 503, 504}
 
 
@@ -1,6 +1,19 @@
+import json
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from lsview.catalog import CatalogError, DEFAULT_CATALOG, load_catalog
+from lsview import catalog as catalog_mod
+from lsview.blockfrost import BlockfrostPoint
+from lsview.catalog import (
+    CatalogEntry,
+    CatalogError,
+    DEFAULT_CATALOG,
+    load_catalog,
+    refresh_catalog,
+    save_catalog,
+)
 
 
 class CatalogTests(unittest.TestCase):
@@ -17,13 +30,80 @@ class CatalogTests(unittest.TestCase):
         self.assertTrue(catalog["constitution-e608"].data["policy_id"])
         self.assertEqual(catalog["the-spec"].data["type"], "manifest_chain_v2")
 
+    def test_save_catalog_roundtrips(self):
+        catalog = load_catalog()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scrolls.json")
+            save_catalog(catalog, path)
+            with open(path, "rb") as f:
+                self.assertTrue(f.read().endswith(b"}\n"))
+            again = load_catalog(path)
+        self.assertEqual({k: e.data for k, e in again.items()}, {k: e.data for k, e in catalog.items()})
+
+    def test_save_catalog_output_does_not_depend_on_orjson(self):
+        entries = {"x": CatalogEntry(id="x", data={"id": "x", "title": "Schöne Schrift"})}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scrolls.json")
+            save_catalog(entries, path)
+            with open(path, "rb") as f:
+                self.assertIn(b'"Sch\\u00f6ne Schrift"', f.read())
+
+    def test_save_catalog_replaces_atomically_and_skips_unchanged(self):
+        catalog = load_catalog()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scrolls.json")
+            save_catalog(catalog, path)
+            os.utime(path, ns=(0, 0))
+            save_catalog(catalog, path)
+            self.assertEqual(os.stat(path).st_mtime_ns, 0)
+            catalog["hosky-png"].data["block_slot"] = 1
+            save_catalog(catalog, path)
+            self.assertNotEqual(os.stat(path).st_mtime_ns, 0)
+            self.assertEqual(os.listdir(tmp), ["scrolls.json"])
+
+    def test_save_catalog_keeps_mode_and_symlink(self):
+        catalog = load_catalog()
+        with tempfile.TemporaryDirectory() as tmp:
+            target = os.path.join(tmp, "real.json")
+            link = os.path.join(tmp, "scrolls.json")
+            save_catalog(catalog, target)
+            os.chmod(target, 0o640)
+            os.symlink(target, link)
+            catalog["hosky-png"].data["block_slot"] = 1
+            save_catalog(catalog, link)
+            self.assertTrue(os.path.islink(link))
+            self.assertEqual(os.stat(target).st_mode & 0o777, 0o640)
+            self.assertEqual(load_catalog(link)["hosky-png"].data["block_slot"], 1)
+
+    def test_repeat_loads_do_not_share_entry_dicts(self):
+        first = load_catalog()
+        first["hosky-png"].data["block_slot"] = 1
+        self.assertNotIn("block_slot", load_catalog()["hosky-png"].data)
+
+    def test_refresh_skips_entries_with_a_known_point(self):
+        scrolls = [
+            {"id": "known", "tx_hash": "aa" * 32, "block_slot": 7, "block_hash": "bb" * 32},
+            {"id": "new", "tx_hash": "cc" * 32},
+        ]
+        point = BlockfrostPoint(slot=9, block_hash="dd" * 32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scrolls.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"scrolls": scrolls}, f)
+            with patch.object(catalog_mod, "resolve_point_from_tx", return_value=point) as resolve:
+                entries = refresh_catalog(path, "key")
+                resolve.assert_called_once_with("cc" * 32, "key")
+                self.assertEqual(entries["new"].data["block_slot"], 9)
+                self.assertEqual(entries["known"].data["block_slot"], 7)
+
+                refresh_catalog(path, "key", force=True)
+                self.assertEqual(resolve.call_count, 3)
+
     def test_missing_catalog_is_a_clear_error(self):
         with self.assertRaisesRegex(CatalogError, "--catalog"):
             load_catalog("/nonexistent/scrolls.json")
 
     def test_invalid_json_is_a_clear_error(self):
-        import tempfile
-
         with tempfile.NamedTemporaryFile("w", suffix=".json") as f:
             f.write("{not json")
             f.flush()
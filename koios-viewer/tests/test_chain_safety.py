@@ -25,6 +25,13 @@ class ChainSafetyTests(unittest.TestCase):
         with self.assertRaises(cli.RegistryError):
             cli.gunzip_bounded(gzip.compress(raw), 100)
 
+    def test_page_segments_decode_like_per_segment_path(self):
+        self.assertEqual(cli._meta_values_to_bytes(["0xab", {"bytes": "cd"}, " EF "]), b"\xab\xcd\xef")
+        self.assertEqual(cli._meta_values_to_bytes([]), b"")
+        for bad in (["abc", "d"], ["ab c", "d"], ["ab", "zz"], ["0x0xab"], ["ab", "0x0xcd"], [{"bytes": "0x0xab"}]):
+            with self.assertRaisesRegex(cli.RegistryError, "Malformed hex"):
+                cli._meta_values_to_bytes(bad)
+
     def test_manifest_cycle_is_rejected(self):
         head = (FIXTURES / "vector-004-head.hex").read_text()
         with patch.object(cli, "utxo_info", return_value=row(head)):
@@ -51,6 +51,14 @@ class Cip25ConformanceTests(unittest.TestCase):
         raw = b"ledger-scrolls" * 64
         self.assertEqual(cli.gunzip_capped(gzip.compress(raw)), raw)
 
+    def test_metadata_label_probe_handles_koios_shapes(self):
+        page = {"i": 1}
+        self.assertIs(cli._metadata_label({"721": page, "674": {}}, "721"), page)
+        self.assertIs(cli._metadata_label({721: page}, "721"), page)
+        self.assertIs(cli._metadata_label([{"label": "674"}, {"label": "721", "json_metadata": page}], "721"), page)
+        self.assertIsNone(cli._metadata_label({"674": {}}, "721"))
+        self.assertIsNone(cli._metadata_label(None, "721"))
+
     def test_malformed_segment_hex_is_a_registry_error(self):
         meta = json.loads((ROOT / "fixtures/cip25/vector-001-metadata.json").read_text())
         policy = next(iter(meta["721"]))
@@ -62,6 +70,25 @@ class Cip25ConformanceTests(unittest.TestCase):
             with self.assertRaisesRegex(cli.RegistryError, "Malformed hex"):
                 cli.reconstruct_legacy_cip25(policy)
 
+    def test_split_or_spaced_segments_still_decode(self):
+        meta = json.loads((ROOT / "fixtures/cip25/vector-001-metadata.json").read_text())
+        policy = next(iter(meta["721"]))
+        assets, rows = koios_rows_from_fixture(meta, policy)
+        with patch.object(cli, "policy_asset_list", return_value=assets), \
+             patch.object(cli, "asset_info_batch", return_value=rows), \
+             patch.object(cli, "tx_metadata", return_value={}):
+            want, _ = cli.reconstruct_legacy_cip25(policy)
+        page = meta["721"][policy]["VEC001_P0001"]
+        joined = "".join(s.removeprefix("0x") for s in page["payload"])
+        for payload in ([joined[:3], joined[3:]], [joined[:4] + " " + joined[4:]]):
+            page["payload"] = payload
+            assets, rows = koios_rows_from_fixture(meta, policy)
+            with patch.object(cli, "policy_asset_list", return_value=assets), \
+                 patch.object(cli, "asset_info_batch", return_value=rows), \
+                 patch.object(cli, "tx_metadata", return_value={}):
+                got, _ = cli.reconstruct_legacy_cip25(policy)
+            self.assertEqual(got, want)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,278 @@
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from lsview import cache, koios
+
+
+class _KoiosStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def _reply(self, status, obj):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.endswith("/moved"):
+            self.send_response(301)
+            self.send_header("Location", self.path.replace("/moved", "/tip"))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path.endswith("/missing"):
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(200, [{"path": self.path}])
+        if self.path.endswith("/hangup"):
+            # drop the socket without announcing Connection: close
+            self.close_connection = True
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._reply(200, [payload])
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchBatchesTests(unittest.TestCase):
+    def test_yields_batches_in_order(self):
+        items = [f"tx{i}" for i in range(23)]
+        got = list(koios.fetch_batches(lambda b: len(b), items, 5, workers=3))
+        self.assertEqual([b for b, _ in got], [items[i : i + 5] for i in range(0, 23, 5)])
+        self.assertEqual([n for _, n in got], [5, 5, 5, 5, 3])
+
+    def test_single_worker_is_sequential(self):
+        seen = []
+        list(koios.fetch_batches(seen.append, ["a", "b", "c"], 2, workers=1))
+        self.assertEqual(seen, [["a", "b"], ["c"]])
+
+    def test_keeps_at_most_workers_in_flight(self):
+        lock = threading.Lock()
+        started = []
+
+        def fetch(batch):
+            with lock:
+                started.append(batch[0])
+            return batch
+
+        fetched = koios.fetch_batches(fetch, [str(i) for i in range(20)], 1, workers=2)
+        next(fetched)
+        fetched.close()
+        self.assertLessEqual(len(started), 3)
+
+    def test_fetch_errors_propagate(self):
+        def fetch(batch):
+            raise koios.KoiosError("boom")
+
+        with self.assertRaisesRegex(koios.KoiosError, "boom"):
+            list(koios.fetch_batches(fetch, ["a", "b"], 1, workers=2))
+
+
+class AssetInfoBatchTests(unittest.TestCase):
+    def test_chunks_are_posted_and_rows_kept_in_order(self):
+        posted = []
+
+        def fake_post(path, payload, timeout=30):
+            names = [h for _, h in payload["_asset_list"]]
+            posted.append(names)
+            return [{"asset_name": h} for h in names]
+
+        names = [f"{i:02x}" for i in range(7)]
+        with patch.object(koios, "koios_post", side_effect=fake_post):
+            rows = koios.asset_info_batch("ab" * 28, names, chunk_size=3, workers=2)
+        self.assertEqual([r["asset_name"] for r in rows], names)
+        self.assertEqual(sorted(posted), [names[0:3], names[3:6], names[6:7]])
+
+
+class TxPointsTests(unittest.TestCase):
+    def test_hashes_are_batched_and_missing_ones_dropped(self):
+        posted = []
+
+        def fake_post(path, payload, timeout=30):
+            posted.append(payload["_tx_hashes"])
+            return [
+                {"tx_hash": h, "absolute_slot": 10 + i, "block_hash": f"b{h}", "block_height": 5 + i}
+                for i, h in enumerate(payload["_tx_hashes"])
+                if h != "gone"
+            ]
+
+        with patch.object(koios, "koios_post", side_effect=fake_post):
+            points = koios.tx_points(["t0", "gone", "t2"], chunk_size=2)
+            with self.assertRaisesRegex(RuntimeError, "tx_info returned empty"):
+                koios.tx_point("gone")
+        self.assertEqual(posted, [["t0", "gone"], ["t2"], ["gone"]])
+        self.assertEqual(points, {
+            "t0": {"slot": 10, "hash": "bt0", "height": 5},
+            "t2": {"slot": 10, "hash": "bt2", "height": 5},
+        })
+
+
+class BlockInfoByHeightsTests(unittest.TestCase):
+    def test_heights_are_deduplicated_sorted_and_chunked(self):
+        queried = []
+
+        def fake_get(path, timeout=30):
+            queried.append(path)
+            heights = path.split("in.(", 1)[1].rstrip(")").split(",")
+            return [
+                {"block_height": int(h), "abs_slot": 100 + int(h), "hash": f"h{h}"}
+                for h in heights
+                if h != "7"
+            ]
+
+        with patch.object(koios, "koios_get", side_effect=fake_get):
+            blocks = koios.block_info_by_heights([9, 3, 7, 3, "5"], chunk_size=2)
+        self.assertEqual(queried, [
+            "blocks?block_height=in.(3,5)",
+            "blocks?block_height=in.(7,9)",
+        ])
+        self.assertEqual(blocks, {
+            3: {"height": 3, "slot": 103, "hash": "h3"},
+            5: {"height": 5, "slot": 105, "hash": "h5"},
+            9: {"height": 9, "slot": 109, "hash": "h9"},
+        })
+
+
+class MemoizedLookupTests(unittest.TestCase):
+    def tearDown(self):
+        koios.clear_koios_caches()
+
+    def test_utxo_info_is_fetched_once_until_cleared(self):
+        row = {"tx_hash": "ab", "inline_datum": {"bytes": "00"}}
+        with patch.object(koios, "koios_post", return_value=[row]) as post:
+            self.assertIs(koios.utxo_info("ab#0"), row)
+            self.assertIs(koios.utxo_info("ab#0"), row)
+            self.assertEqual(post.call_count, 1)
+            koios.clear_koios_caches()
+            koios.utxo_info("ab#0")
+            self.assertEqual(post.call_count, 2)
+
+    def test_failures_are_not_memoized(self):
+        with patch.object(koios, "koios_post", side_effect=[[], [{"tx_hash": "cd"}]]):
+            with self.assertRaises(koios.KoiosError):
+                koios.utxo_info("cd#1")
+            self.assertEqual(koios.utxo_info("cd#1"), {"tx_hash": "cd"})
+
+
+class EnvWorkersTests(unittest.TestCase):
+    def test_bad_worker_count_falls_back_to_default(self):
+        for value, expected in (("8", 8), ("0", 1), ("lots", 4), ("", 4)):
+            with patch.dict("os.environ", {"LS_KOIOS_WORKERS": value}):
+                self.assertEqual(koios._env_workers(), expected)
+
+
+class TxMetadataCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = patch.dict("os.environ", {"LS_KOIOS_CACHE": f"{self.tmp.name}/koios.sqlite"})
+        self.env.start()
+        cache.close_cache()
+
+    def tearDown(self):
+        cache.close_cache()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_only_uncached_hashes_are_requested(self):
+        posted = []
+
+        def fake_post(path, payload, timeout=30):
+            posted.append(payload["_tx_hashes"])
+            return [{"tx_hash": h, "metadata": {"674": h}} for h in payload["_tx_hashes"] if h != "gone"]
+
+        with patch.object(koios, "koios_post", side_effect=fake_post):
+            first = koios.tx_metadata(["aa", "bb"])
+            second = koios.tx_metadata(["bb", "cc", "gone"])
+            third = koios.tx_metadata(["aa", "cc"])
+        self.assertEqual(first, {"aa": {"674": "aa"}, "bb": {"674": "bb"}})
+        self.assertEqual(second, {"bb": {"674": "bb"}, "cc": {"674": "cc"}})
+        self.assertEqual(third, {"aa": {"674": "aa"}, "cc": {"674": "cc"}})
+        self.assertEqual(posted, [["aa", "bb"], ["cc", "gone"]])
+
+    def test_expired_rows_are_purged_on_open(self):
+        cache.put_many("ns", {"old": 1})
+        cache.close_cache()
+        later = time.time() + cache.CACHE_TTL + 60
+        with patch.object(cache.time, "time", return_value=later):
+            cache.put_many("ns", {"new": 2})
+            self.assertEqual(cache.get_many("ns", ["old", "new"]), {"new": 2})
+        cache.close_cache()
+        db = sqlite3.connect(str(cache.cache_path()))
+        try:
+            self.assertEqual([k for (k,) in db.execute("SELECT key FROM kv")], ["new"])
+        finally:
+            db.close()
+
+    def test_off_disables_the_cache(self):
+        with patch.dict("os.environ", {"LS_KOIOS_CACHE": "off"}):
+            cache.close_cache()
+            cache.put_many("ns", {"k": 1})
+            self.assertEqual(cache.get_many("ns", ["k"]), {})
+
+
+class PooledConnectionTests(unittest.TestCase):
+    def setUp(self):
+        _KoiosStub.connections = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KoiosStub)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+        self.env = patch.dict("os.environ", {}, clear=True)
+        self.env.start()
+
+    def tearDown(self):
+        koios.close_connections()
+        self.env.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_share_one_connection(self):
+        with patch.object(koios, "KOIOS", self.base):
+            self.assertEqual(koios.koios_get("tip?x=1"), [{"path": "/api/v1/tip?x=1"}])
+            self.assertEqual(koios.koios_post("tx_info", {"_tx_hashes": ["ab"]}), [{"_tx_hashes": ["ab"]}])
+            koios.koios_get("tip")
+        self.assertEqual(_KoiosStub.connections, 1)
+
+    def test_http_errors_keep_urllib_types(self):
+        with patch.object(koios, "KOIOS", self.base):
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                koios.koios_get("missing")
+        self.assertEqual(ctx.exception.code, 404)
+
+    def test_redirects_are_followed(self):
+        with patch.object(koios, "KOIOS", self.base):
+            self.assertEqual(koios.koios_get("moved"), [{"path": "/api/v1/tip"}])
+
+    def test_fetch_batches_workers_reuse_their_connections(self):
+        def fetch(batch):
+            return koios.koios_get(f"tip?b={batch[0]}")
+
+        with patch.object(koios, "KOIOS", self.base):
+            for _ in range(2):
+                got = list(koios.fetch_batches(fetch, [str(i) for i in range(8)], 1, workers=4))
+                self.assertEqual(len(got), 8)
+        self.assertLessEqual(_KoiosStub.connections, 4)
+
+    def test_dropped_keepalive_socket_is_reopened(self):
+        with patch.object(koios, "KOIOS", self.base):
+            koios.koios_get("hangup")
+            self.assertEqual(koios.koios_get("tip"), [{"path": "/api/v1/tip"}])
+        self.assertEqual(_KoiosStub.connections, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
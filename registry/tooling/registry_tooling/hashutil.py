@@ -3,12 +3,42 @@ import hashlib
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install ledger-scrolls-registry[fast])
+    orjson = None
+
+
+_PLAIN_SCALARS = (str, int, bool, type(None))
+
+
+def _orjson_matches_stdlib(obj: Any) -> bool:
+    """Whether orjson's OPT_SORT_KEYS output is byte-identical to the stdlib
+    rule below: plain dicts/lists/str/int/bool/None only. Floats are excluded
+    because the two libraries format them differently (1e+16 vs 1e16)."""
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        t = type(x)
+        if t is dict:
+            stack.extend(x.values())
+        elif t is list:
+            stack.extend(x)
+        elif t not in _PLAIN_SCALARS:
+            return False
+    return True
+
 
 def canonical_json_bytes(obj: Any) -> bytes:
     """Deterministic JSON serialization.
 
     v0 rule: stable key ordering + no insignificant whitespace.
     """
+    if orjson is not None and _orjson_matches_stdlib(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:  # non-str keys, ints wider than 64 bits, lone surrogates
+            pass
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
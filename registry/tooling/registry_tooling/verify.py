@@ -2,9 +2,12 @@ import argparse
 import hashlib
 import json
 import os
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
@@ -12,16 +15,64 @@ from .hashutil import canonical_json_bytes
 
 
 KOIOS_BASE = os.environ.get("LSR_KOIOS_BASE", "https://api.koios.rest/api/v1")
+_CHUNK = 1 << 20
 
 
 class RegistryError(RuntimeError):
     pass
 
 
+_SESSION: Optional[requests.Session] = None
+
+
+def _session() -> requests.Session:
+    """Shared keep-alive session: resolving a name makes several Koios/URL
+    fetches, and a fresh requests.get() would redo TCP + TLS for each one.
+    Transient statuses are retried at the adapter (Koios reads are POSTs but
+    idempotent, so POST is retried too)."""
+    global _SESSION
+    if _SESSION is None:
+        retry = Retry(
+            total=5,
+            backoff_factor=0.6,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        s = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _SESSION = s
+    return _SESSION
+
+
+def close_session() -> None:
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
+
 def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def sha256_hex_stream(chunks: Iterable[bytes]) -> str:
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def sha256_hex_path(path: str) -> str:
+    """SHA-256 of a file in constant memory."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        return sha256_hex_stream(iter(lambda: f.read(_CHUNK), b""))
+
+
 def verify_head_signature(head: Dict[str, Any], trusted_key: Optional[str] = None) -> str:
     """Verify a registry-v1 Ed25519 envelope; return the authenticated key id.
 
@@ -119,6 +170,22 @@ def _decode_cbor_bytestring(raw: bytes) -> bytes:
         return raw
 
 
+def _url_pointer_path(url: str, base_dir: Optional[str]) -> Optional[str]:
+    """Local filesystem path for a kind=url pointer, or None for http(s)."""
+    if url.startswith("http://") or url.startswith("https://"):
+        return None
+
+    if url.startswith("./") or url.startswith("../") or (not "://" in url and not url.startswith("/")):
+        if not base_dir:
+            raise RegistryError("Relative url pointer requires base_dir")
+        return os.path.normpath(os.path.join(base_dir, url))
+
+    if url.startswith("file://"):
+        return url[len("file://") :]
+
+    raise RegistryError(f"Unsupported url pointer: {url}")
+
+
 def read_bytes_from_url(url: str, base_dir: Optional[str] = None) -> bytes:
     """Fetch bytes for pointer kind=url.
 
@@ -126,24 +193,23 @@ def read_bytes_from_url(url: str, base_dir: Optional[str] = None) -> bytes:
     - http(s) URLs
     - local relative paths when url starts with ./ or ../ (resolved relative to base_dir)
     """
-    if url.startswith("http://") or url.startswith("https://"):
-        r = requests.get(url, timeout=30)
+    path = _url_pointer_path(url, base_dir)
+    if path is None:
+        r = _session().get(url, timeout=30)
         r.raise_for_status()
         return r.content
+    with open(path, "rb") as f:
+        return f.read()
 
-    if url.startswith("./") or url.startswith("../") or (not "://" in url and not url.startswith("/")):
-        if not base_dir:
-            raise RegistryError("Relative url pointer requires base_dir")
-        path = os.path.normpath(os.path.join(base_dir, url))
-        with open(path, "rb") as f:
-            return f.read()
-
-    if url.startswith("file://"):
-        path = url[len("file://") :]
-        with open(path, "rb") as f:
-            return f.read()
 
-    raise RegistryError(f"Unsupported url pointer: {url}")
+def sha256_hex_from_url(url: str, base_dir: Optional[str] = None) -> str:
+    """Like sha256_hex(read_bytes_from_url(...)), without holding the payload."""
+    path = _url_pointer_path(url, base_dir)
+    if path is not None:
+        return sha256_hex_path(path)
+    with _session().get(url, timeout=30, stream=True) as r:
+        r.raise_for_status()
+        return sha256_hex_stream(r.iter_content(_CHUNK))
 
 
 def read_bytes_from_utxo_inline_datum(tx_hash: str, tx_ix: int) -> bytes:
@@ -151,7 +217,7 @@ def read_bytes_from_utxo_inline_datum(tx_hash: str, tx_ix: int) -> bytes:
 
     _extended is required: without it Koios omits inline_datum.
     """
-    r = requests.post(
+    r = _session().post(
         f"{KOIOS_BASE}/utxo_info",
         json={"_utxo_refs": [f"{tx_hash}#{tx_ix}"], "_extended": True},
         timeout=30,
@@ -209,6 +275,14 @@ def fetch_bytes_from_pointer(pointer: Dict[str, Any], *, base_dir: Optional[str]
     raise RegistryError(f"Unknown pointer kind: {kind}")
 
 
+def sha256_hex_from_pointer(pointer: Dict[str, Any], *, base_dir: Optional[str]) -> str:
+    """Digest of a pointer's bytes; url pointers are hashed as they stream."""
+    pointer = normalize_pointer(pointer)
+    if pointer.get("kind") == "url":
+        return sha256_hex_from_url(pointer["url"], base_dir=base_dir)
+    return sha256_hex(fetch_bytes_from_pointer(pointer, base_dir=base_dir))
+
+
 def load_registry_list_from_head(head: Dict[str, Any], *, head_path: str) -> Tuple[Dict[str, Any], str]:
     pointer = head.get("registryList")
     if not isinstance(pointer, dict):
@@ -222,63 +296,96 @@ def load_registry_list_from_head(head: Dict[str, Any], *, head_path: str) -> Tup
     return lst, base_dir
 
 
-def find_entry(registry_list: Dict[str, Any], name: str) -> Dict[str, Any]:
+def index_entries(registry_list: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map name -> entry; the first entry wins on duplicate names."""
     entries = registry_list.get("entries")
     if not isinstance(entries, list):
         raise RegistryError("registry list missing entries[]")
 
+    index: Dict[str, Dict[str, Any]] = {}
     for e in entries:
-        if isinstance(e, dict) and e.get("name") == name:
-            return e
-    raise RegistryError(f"name not found: {name}")
+        if isinstance(e, dict) and isinstance(e.get("name"), str):
+            index.setdefault(e["name"], e)
+    return index
 
 
-def verify_name(head_path: str, name: str, trusted_key: Optional[str] = None) -> None:
-    head = load_json(head_path)
-    signer_status = verify_head_signature(head, trusted_key)
+def find_entry(registry_list: Dict[str, Any], name: str, *, index: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Look up one entry; pass a prebuilt index_entries() map when resolving many names."""
+    entry = (index if index is not None else index_entries(registry_list)).get(name)
+    if entry is None:
+        raise RegistryError(f"name not found: {name}")
+    return entry
+
 
+@lru_cache(maxsize=8)
+def _load_head(head_path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    head = load_json(head_path)
     # Optional: show deterministic head hash (canonical JSON)
-    head_hash = sha256_hex(canonical_json_bytes(head))
+    return head, sha256_hex(canonical_json_bytes(head))
+
+
+def load_head_once(head_path: str) -> Tuple[Dict[str, Any], str]:
+    """Parse a head and hash its canonical JSON once per (path, mtime, size).
+
+    The returned head is shared between callers; treat it as read-only.
+    """
+    path = os.path.abspath(head_path)
+    st = os.stat(path)
+    return _load_head(path, st.st_mtime_ns, st.st_size)
+
+
+def verify_names(head_path: str, names: List[str], trusted_key: Optional[str] = None) -> None:
+    """Verify several names against one head; the head signature, hash and
+    registry list are resolved once for the whole batch."""
+    head, head_hash = load_head_once(head_path)
+    signer_status = verify_head_signature(head, trusted_key)
 
     reg_list, base_dir = load_registry_list_from_head(head, head_path=head_path)
 
-    entry = find_entry(reg_list, name)
+    index = index_entries(reg_list)
+    failed = False
+    for name in names:
+        entry = find_entry(reg_list, name, index=index)
 
-    pointer = entry.get("pointer")
-    if not isinstance(pointer, dict):
-        raise RegistryError("entry.pointer must be a pointer object")
+        pointer = entry.get("pointer")
+        if not isinstance(pointer, dict):
+            raise RegistryError("entry.pointer must be a pointer object")
 
-    expected = entry.get("sha256")
-    if not isinstance(expected, str) or not expected:
-        raise RegistryError("entry.sha256 missing")
+        expected = entry.get("sha256")
+        if not isinstance(expected, str) or not expected:
+            raise RegistryError("entry.sha256 missing")
 
-    data = fetch_bytes_from_pointer(pointer, base_dir=base_dir)
-    got = sha256_hex(data)
+        got = sha256_hex_from_pointer(pointer, base_dir=base_dir)
 
-    ok = got.lower() == expected.lower()
+        ok = got.lower() == expected.lower()
+        failed = failed or not ok
 
-    print(json.dumps({
-        "headHash": head_hash,
-        "headSigner": signer_status,
-        "name": name,
-        "contentType": entry.get("contentType"),
-        "bytesSha256": got,
-        "expectedSha256": expected,
-        "ok": ok
-    }, indent=2))
+        print(json.dumps({
+            "headHash": head_hash,
+            "headSigner": signer_status,
+            "name": name,
+            "contentType": entry.get("contentType"),
+            "bytesSha256": got,
+            "expectedSha256": expected,
+            "ok": ok
+        }, indent=2))
 
-    if not ok:
+    if failed:
         raise SystemExit(2)
 
 
+def verify_name(head_path: str, name: str, trusted_key: Optional[str] = None) -> None:
+    verify_names(head_path, [name], trusted_key)
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="Verify Ledger Scrolls Registry resolution (v0/v1)")
     ap.add_argument("--head", required=True, help="Path to registry head JSON")
-    ap.add_argument("--name", required=True, help="Entry name to resolve")
+    ap.add_argument("--name", required=True, action="append", help="Entry name to resolve (repeatable)")
     ap.add_argument("--trusted-key", help="Pinned 32-byte Ed25519 public key hex; rejects unsigned/other signers")
     args = ap.parse_args()
 
-    verify_name(args.head, args.name, args.trusted_key)
+    verify_names(args.head, args.name, args.trusted_key)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+import json
+import unittest
+from pathlib import Path
+
+from registry_tooling import hashutil
+from registry_tooling.hashutil import canonical_json_bytes
+
+REGISTRY = Path(__file__).resolve().parents[2]
+
+
+def stdlib_canonical(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+EDGE_CASES = [
+    {"b": 1, "a": [True, None, "é \x1f\"\\"], "é": {"z": -1, "Z": 2**63}},
+    {"float": 1e16, "nan": float("nan"), "neg": -0.0},
+    {"wide": 2**70, "neg_wide": -(2**64)},
+    {1: "int key"},
+    ["tuple", (1, 2)],
+]
+
+
+class CanonicalJsonTests(unittest.TestCase):
+    def test_matches_stdlib_rule_on_registry_files_and_edge_cases(self):
+        objs = [json.loads(p.read_text("utf-8")) for p in sorted(REGISTRY.glob("*/*.json"))]
+        self.assertTrue(objs)
+        for obj in objs + EDGE_CASES:
+            self.assertEqual(canonical_json_bytes(obj), stdlib_canonical(obj), obj)
+
+    @unittest.skipUnless(hashutil.orjson is not None, "orjson not installed")
+    def test_fast_path_only_for_plain_json_types(self):
+        self.assertTrue(hashutil._orjson_matches_stdlib(EDGE_CASES[0]))
+        self.assertFalse(hashutil._orjson_matches_stdlib(EDGE_CASES[1]))
+        self.assertFalse(hashutil._orjson_matches_stdlib(EDGE_CASES[4]))
+
+
+if __name__ == "__main__":
+    unittest.main()
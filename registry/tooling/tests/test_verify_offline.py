@@ -6,7 +6,15 @@ import os
 import tempfile
 import unittest
 
-from registry_tooling.verify import normalize_pointer, verify_name
+from registry_tooling.verify import (
+    RegistryError,
+    find_entry,
+    index_entries,
+    normalize_pointer,
+    sha256_hex_from_pointer,
+    verify_name,
+    verify_names,
+)
 
 
 def write_registry(tmp: str, payload: bytes, sha256: str):
@@ -55,6 +63,44 @@ class VerifyNameOfflineTests(unittest.TestCase):
                     verify_name(head_path, "payload")
         self.assertEqual(ctx.exception.code, 2)
 
+    def test_batch_prints_one_report_per_name(self):
+        payload = b"many names, one head"
+        with tempfile.TemporaryDirectory() as tmp:
+            head_path = write_registry(tmp, payload, hashlib.sha256(payload).hexdigest())
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                verify_names(head_path, ["payload", "payload"])
+            with contextlib.redirect_stdout(io.StringIO()):
+                with self.assertRaisesRegex(RegistryError, "name not found"):
+                    verify_names(head_path, ["payload", "missing"])
+        text, reports, pos = out.getvalue(), [], 0
+        while pos < len(text.rstrip()):
+            obj, pos = json.JSONDecoder().raw_decode(text, pos)
+            reports.append(obj)
+            pos += 1
+        self.assertEqual([r["ok"] for r in reports], [True, True])
+
+
+class FindEntryTests(unittest.TestCase):
+    def test_index_keeps_first_duplicate(self):
+        lst = {"entries": [{"name": "a", "v": 1}, "junk", {"name": "a", "v": 2}, {"name": "b", "v": 3}]}
+        index = index_entries(lst)
+        self.assertEqual(find_entry(lst, "a"), {"name": "a", "v": 1})
+        self.assertEqual(find_entry(lst, "b", index=index)["v"], 3)
+        with self.assertRaisesRegex(RegistryError, "name not found: c"):
+            find_entry(lst, "c", index=index)
+
+
+class PointerDigestTests(unittest.TestCase):
+    def test_streamed_digest_matches_read_bytes(self):
+        payload = os.urandom(3 << 20)
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "blob.bin"), "wb") as f:
+                f.write(payload)
+            for url in ("./blob.bin", "file://" + os.path.join(tmp, "blob.bin")):
+                got = sha256_hex_from_pointer({"kind": "url", "url": url}, base_dir=tmp)
+                self.assertEqual(got, hashlib.sha256(payload).hexdigest(), url)
+
 
 class NormalizePointerTests(unittest.TestCase):
     def test_legacy_utxo_locked_bytes(self):
@@ -18,16 +18,22 @@ import struct
 import sys
 
 
+# CBOR head byte + big-endian argument, packed in one call
+_HEAD_U16 = struct.Struct(">BH")
+_HEAD_U32 = struct.Struct(">BI")
+_HEAD_U64 = struct.Struct(">BQ")
+
+
 def cbor_uint(major: int, n: int) -> bytes:
     if n < 24:
         return bytes([(major << 5) | n])
     if n < 256:
         return bytes([(major << 5) | 24, n])
     if n < 65536:
-        return bytes([(major << 5) | 25]) + struct.pack(">H", n)
+        return _HEAD_U16.pack((major << 5) | 25, n)
     if n < 2**32:
-        return bytes([(major << 5) | 26]) + struct.pack(">I", n)
-    return bytes([(major << 5) | 27]) + struct.pack(">Q", n)
+        return _HEAD_U32.pack((major << 5) | 26, n)
+    return _HEAD_U64.pack((major << 5) | 27, n)
 
 
 def enc_int(n: int) -> bytes:
@@ -32,7 +32,9 @@ import hashlib
 import io
 import json
 import os
+import queue
 import sys
+import threading
 import urllib.error
 import urllib.request
 
@@ -116,8 +118,28 @@ def max_segments_per_page(
     return best
 
 
+def _probe_max_tx_size(base: str) -> int | None:
+    url = f"{base}/epoch_params?order=epoch_no.desc&limit=1"
+    try:
+        with urllib.request.urlopen(url, timeout=8) as r:
+            rows = json.loads(r.read().decode())
+        if rows and rows[0].get("max_tx_size"):
+            live = int(rows[0]["max_tx_size"])
+            # Clamp: accept a genuinely lower limit, never an inflated one
+            # (a bogus large value would make every page tx oversized).
+            if live >= 4096:
+                return min(live, DEFAULT_MAX_TX_SIZE)
+    except (urllib.error.URLError, TimeoutError, ValueError, KeyError, IndexError, json.JSONDecodeError):
+        pass
+    return None
+
+
 def fetch_max_tx_size(network: str = "mainnet") -> int:
-    """Best-effort live max_tx_size from Koios; falls back to 16384."""
+    """Best-effort live max_tx_size from Koios; falls back to 16384.
+
+    Mirrors are probed concurrently and the first usable answer wins, so a
+    stalled mirror costs nothing when another one is up.
+    """
     bases = {
         "mainnet": [
             "https://koios.beacn.workers.dev/api/v1",
@@ -128,19 +150,23 @@ def fetch_max_tx_size(network: str = "mainnet") -> int:
             "https://preview.koios.rest/api/v1",
         ],
     }.get(network, [])
-    for base in bases:
-        url = f"{base}/epoch_params?order=epoch_no.desc&limit=1"
+    results: "queue.Queue[int | None]" = queue.Queue()
+
+    def probe(base: str) -> None:
+        live = None
         try:
-            with urllib.request.urlopen(url, timeout=8) as r:
-                rows = json.loads(r.read().decode())
-            if rows and rows[0].get("max_tx_size"):
-                live = int(rows[0]["max_tx_size"])
-                # Clamp: accept a genuinely lower limit, never an inflated one
-                # (a bogus large value would make every page tx oversized).
-                if live >= 4096:
-                    return min(live, DEFAULT_MAX_TX_SIZE)
-        except (urllib.error.URLError, TimeoutError, ValueError, KeyError, IndexError, json.JSONDecodeError):
-            continue
+            live = _probe_max_tx_size(base)
+        finally:
+            results.put(live)
+
+    # Daemon threads: a mirror still hanging after we have an answer must
+    # not hold up interpreter exit.
+    for base in bases:
+        threading.Thread(target=probe, args=(base,), daemon=True).start()
+    for _ in bases:
+        live = results.get()
+        if live is not None:
+            return live
     return DEFAULT_MAX_TX_SIZE
 
 
@@ -244,8 +270,9 @@ def main() -> None:
                 "p": ["0x" + s.hex() for s in segs],
             }
         }
+        # json.dumps (unlike json.dump) uses the C encoder and lands in one write.
         with open(os.path.join(args.out, f"page-{idx:04d}.json"), "w") as f:
-            json.dump(meta, f, separators=(",", ":"))
+            f.write(json.dumps(meta, separators=(",", ":")))
 
     tx_est = estimate_page_tx_bytes(segments_per_page, n_pages=n)
     fee_lovelace = FEE_A * tx_est + FEE_B
@@ -272,8 +299,7 @@ def main() -> None:
         "metadataLabel": int(METADATA_LABEL),
     }
     with open(os.path.join(args.out, "plan.json"), "w") as f:
-        json.dump(plan, f, indent=2)
-        f.write("\n")
+        f.write(json.dumps(plan, indent=2) + "\n")
 
     density = (page_size / tx_est) if tx_est else 0
     print(f"file: {args.file}")
@@ -10,11 +10,11 @@ Ledger Scrolls: Zero-Dependency Constitution Reader
 from __future__ import annotations
 
 import argparse
-import gzip
 import hashlib
 import json
 import time
 import urllib.request
+import zlib
 from typing import Any, Dict, Iterable, List, Tuple
 
 KOIOS = "https://api.koios.rest/api/v1"
@@ -123,6 +123,52 @@ def fetch_tx_metadata(tx_hashes: List[str]) -> Dict[str, Any]:
     return out
 
 
+def decode_pages(pages: List[Tuple[int, List[Any]]]) -> bytes:
+    """Decode sorted pages to bytes, gunzipping page by page when the payload is gzip.
+
+    The compressed stream is inflated as each page's hex is decoded, so the full
+    compressed blob is never held next to the output.
+    """
+    out = bytearray()
+    inflater = None
+    pending = b""  # decoded bytes held until the gzip magic can be checked
+    carry = ""  # odd trailing nibble of a page, completed by the next one
+    for _, payload in pages:
+        # fromhex skips whitespace, so drop it before counting nibbles.
+        hex_text = carry + "".join("".join(clean_seg(seg).split()) for seg in payload)
+        cut = len(hex_text) - (len(hex_text) & 1)
+        carry = hex_text[cut:]
+        chunk = bytes.fromhex(hex_text[:cut])
+        if inflater is None and not out:
+            pending += chunk
+            if len(pending) < 2:
+                continue
+            chunk, pending = pending, b""
+            if chunk.startswith(b"\x1f\x8b"):
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if inflater is None:
+            out += chunk
+            continue
+        while chunk:
+            if inflater.eof:
+                # Like gzip.decompress: NUL padding after a member is skipped and
+                # anything else starts the next concatenated member.
+                chunk = chunk.lstrip(b"\0")
+                if not chunk:
+                    break
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            out += inflater.decompress(chunk)
+            chunk = inflater.unused_data if inflater.eof else b""
+    if carry:
+        raise ValueError("odd-length hex payload")
+    if inflater is None:
+        return bytes(out + pending)
+    out += inflater.flush()
+    if not inflater.eof:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+    return bytes(out)
+
+
 def reconstruct(policy_id: str, expected_sha256: str) -> Tuple[bytes, str]:
     assets = fetch_policy_assets(policy_id)
     if not assets:
@@ -184,11 +230,7 @@ def reconstruct(policy_id: str, expected_sha256: str) -> Tuple[bytes, str]:
         raise KoiosError("No pages found in metadata.")
 
     pages.sort(key=lambda x: x[0])
-    hex_blob = "".join("".join(clean_seg(seg) for seg in payload) for _, payload in pages)
-    raw = bytes.fromhex(hex_blob)
-
-    if raw.startswith(b"\x1f\x8b"):
-        raw = gzip.decompress(raw)
+    raw = decode_pages(pages)
 
     sha = hashlib.sha256(raw).hexdigest()
     if expected_sha256 and sha.lower() != expected_sha256.lower():
@@ -10,15 +10,18 @@ Ledger Scrolls: Zero-Dependency Scroll Reader (Koios)
 from __future__ import annotations
 
 import argparse
-import gzip
 import hashlib
 import json
 import os
 import time
 import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Tuple
 
 DEFAULT_KOIOS = "https://api.koios.rest/api/v1"
+# Scrolls fetched at once by --all; kept small to stay under public rate limits.
+FETCH_WORKERS = 4
 
 SCROLLS: Dict[str, Dict[str, Any]] = {
     "hosky-png": {
@@ -193,6 +196,52 @@ def _clean_seg(seg: Any) -> str:
     return s[2:] if s.lower().startswith("0x") else s
 
 
+def decode_pages(pages: List[Tuple[int, List[Any]]]) -> bytes:
+    """Decode sorted pages to bytes, gunzipping page by page when the payload is gzip.
+
+    The compressed stream is inflated as each page's hex is decoded, so the full
+    compressed blob is never held next to the output.
+    """
+    out = bytearray()
+    inflater = None
+    pending = b""  # decoded bytes held until the gzip magic can be checked
+    carry = ""  # odd trailing nibble of a page, completed by the next one
+    for _, payload in pages:
+        # fromhex skips whitespace, so drop it before counting nibbles.
+        hex_text = carry + "".join("".join(_clean_seg(seg).split()) for seg in payload)
+        cut = len(hex_text) - (len(hex_text) & 1)
+        carry = hex_text[cut:]
+        chunk = bytes.fromhex(hex_text[:cut])
+        if inflater is None and not out:
+            pending += chunk
+            if len(pending) < 2:
+                continue
+            chunk, pending = pending, b""
+            if chunk.startswith(b"\x1f\x8b"):
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if inflater is None:
+            out += chunk
+            continue
+        while chunk:
+            if inflater.eof:
+                # Like gzip.decompress: NUL padding after a member is skipped and
+                # anything else starts the next concatenated member.
+                chunk = chunk.lstrip(b"\0")
+                if not chunk:
+                    break
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            out += inflater.decompress(chunk)
+            chunk = inflater.unused_data if inflater.eof else b""
+    if carry:
+        raise ValueError("odd-length hex payload")
+    if inflater is None:
+        return bytes(out + pending)
+    out += inflater.flush()
+    if not inflater.eof:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+    return bytes(out)
+
+
 def reconstruct_legacy(policy_id: str, manifest_asset: str | None = None, expected_sha256: str | None = None, koios_base: str = DEFAULT_KOIOS) -> Tuple[bytes, str]:
     assets = fetch_policy_assets(policy_id, koios_base=koios_base)
     if not assets:
@@ -266,11 +315,7 @@ def reconstruct_legacy(policy_id: str, manifest_asset: str | None = None, expect
         raise KoiosError("No pages found in metadata.")
 
     pages.sort(key=lambda x: x[0])
-    hex_blob = "".join("".join(_clean_seg(seg) for seg in payload) for _, payload in pages)
-    raw = bytes.fromhex(hex_blob)
-
-    if raw.startswith(b"\x1f\x8b"):
-        raw = gzip.decompress(raw)
+    raw = decode_pages(pages)
 
     sha = hashlib.sha256(raw).hexdigest()
     if expected_sha256 and sha.lower() != expected_sha256.lower():
@@ -338,43 +383,49 @@ def main() -> None:
     targets = list(SCROLLS.items()) if args.all else [(args.scroll, SCROLLS[args.scroll])]
     report: List[Dict[str, Any]] = []
 
-    for scroll_id, info in targets:
-        data, sha = read_one(scroll_id, info, koios_base=args.koios)
-
-        if args.verify:
-            expected_sha256 = info.get("sha256")
-            is_verified = bool(expected_sha256)
-            status = "verified" if is_verified else "hashed"
-            print(f"OK — {scroll_id} SHA-256: {sha}")
-            report.append(
-                {
-                    "scroll": scroll_id,
-                    "sha256": sha,
-                    "expected_sha256": expected_sha256,
-                    "bytes": len(data),
-                    "status": status,
-                    "verified": is_verified,
-                }
-            )
-            continue
-
-        if args.save:
-            out = resolve_output_path(scroll_id, args.out, args.output_dir, info.get("content_type"))
-            with open(out, "wb") as f:
-                f.write(data)
-            print(f"Reconstructed: {out}")
+    # Scrolls are independent, so --all fetches a few at a time. map() yields
+    # in catalog order, so each scroll is reported as soon as it and the ones
+    # before it are done; a failure cancels the fetches that have not started.
+    pool = ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(targets)))
+    try:
+        results = pool.map(lambda t: read_one(t[0], t[1], koios_base=args.koios), targets)
+        for (scroll_id, info), (data, sha) in zip(targets, results):
+            if args.verify:
+                expected_sha256 = info.get("sha256")
+                is_verified = bool(expected_sha256)
+                status = "verified" if is_verified else "hashed"
+                print(f"OK — {scroll_id} SHA-256: {sha}")
+                report.append(
+                    {
+                        "scroll": scroll_id,
+                        "sha256": sha,
+                        "expected_sha256": expected_sha256,
+                        "bytes": len(data),
+                        "status": status,
+                        "verified": is_verified,
+                    }
+                )
+                continue
+
+            if args.save:
+                out = resolve_output_path(scroll_id, args.out, args.output_dir, info.get("content_type"))
+                with open(out, "wb") as f:
+                    f.write(data)
+                print(f"Reconstructed: {out}")
+                print(f"Bytes: {len(data)}")
+                print(f"SHA-256: {sha}")
+                report.append({"scroll": scroll_id, "sha256": sha, "bytes": len(data), "status": "saved", "path": out})
+                continue
+
+            preview = data.decode("utf-8", errors="ignore").splitlines()[:30]
+            print("\n".join(preview))
+            print("\n---")
+            print(f"Scroll: {scroll_id}")
             print(f"Bytes: {len(data)}")
             print(f"SHA-256: {sha}")
-            report.append({"scroll": scroll_id, "sha256": sha, "bytes": len(data), "status": "saved", "path": out})
-            continue
-
-        preview = data.decode("utf-8", errors="ignore").splitlines()[:30]
-        print("\n".join(preview))
-        print("\n---")
-        print(f"Scroll: {scroll_id}")
-        print(f"Bytes: {len(data)}")
-        print(f"SHA-256: {sha}")
-        report.append({"scroll": scroll_id, "sha256": sha, "bytes": len(data), "status": "preview"})
+            report.append({"scroll": scroll_id, "sha256": sha, "bytes": len(data), "status": "preview"})
+    finally:
+        pool.shutdown(cancel_futures=True)
 
     if args.json_report:
         with open(args.json_report, "w", encoding="utf-8") as f:
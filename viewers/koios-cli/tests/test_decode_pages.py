@@ -0,0 +1,56 @@
+import gzip
+import unittest
+
+import read_constitution
+import read_scroll
+
+
+def paged(blob: bytes, sizes):
+    """Split blob's hex into pages of the given hex lengths (cycled), mixing segment shapes."""
+    hex_text = blob.hex()
+    pages, pos, i = [], 0, 0
+    while pos < len(hex_text):
+        n = sizes[i % len(sizes)]
+        seg = hex_text[pos : pos + n]
+        pages.append((i, [{"bytes": seg}] if i % 2 else ["0x" + seg]))
+        pos, i = pos + n, i + 1
+    return pages
+
+
+class DecodePagesTests(unittest.TestCase):
+    def assertDecodesLikeGzip(self, blob: bytes):
+        expected = gzip.decompress(blob) if blob.startswith(b"\x1f\x8b") else blob
+        for sizes in ((1,), (3, 7), (2,), (len(blob.hex()) or 1,)):
+            for mod in (read_scroll, read_constitution):
+                self.assertEqual(mod.decode_pages(paged(blob, sizes)), expected, (mod.__name__, sizes))
+
+    def test_plain_and_gzip_payloads(self):
+        raw = b"ledger-scrolls " * 50
+        self.assertDecodesLikeGzip(raw)
+        self.assertDecodesLikeGzip(gzip.compress(raw))
+        self.assertDecodesLikeGzip(b"\x1f")
+        self.assertDecodesLikeGzip(b"")
+
+    def test_concatenated_members_and_nul_padding(self):
+        a, b = gzip.compress(b"first "), gzip.compress(b"second")
+        self.assertDecodesLikeGzip(a + b)
+        self.assertDecodesLikeGzip(a + b"\0" * 4)
+        self.assertDecodesLikeGzip(a + b"\0" * 3 + b)
+
+    def test_whitespace_between_bytes_is_ignored(self):
+        blob = gzip.compress(b"spaced")
+        h = blob.hex()
+        for mod in (read_scroll, read_constitution):
+            self.assertEqual(mod.decode_pages([(0, [h[:2] + " " + h[2:]])]), b"spaced")
+            self.assertEqual(mod.decode_pages([(0, [h[:3]]), (1, [h[3:5] + "\n" + h[5:]])]), b"spaced")
+
+    def test_truncated_gzip_and_odd_hex_are_errors(self):
+        truncated = gzip.compress(b"x" * 1000)[:-10]
+        with self.assertRaises(EOFError):
+            read_scroll.decode_pages([(0, [truncated.hex()])])
+        with self.assertRaises(ValueError):
+            read_constitution.decode_pages([(0, ["abc"])])
+
+
+if __name__ == "__main__":
+    unittest.main()